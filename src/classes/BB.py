@@ -33,7 +33,7 @@ class BB(SubProblem):
         identity.setdiag([sense2sign[sense] for sense in self.senses])
 
         return self.model.addMConstr(
-            hstack([self.W, identity]),
+            hstack([self.W, identity], format="csr"),
             None,
             self.senses,
             self.h,
@@ -2,8 +2,8 @@ import logging
 from typing import List, Optional
 
 import numpy as np
-from gurobipy import GRB, MVar, Var
-from scipy.sparse import hstack
+from gurobipy import GRB, Var
+from scipy.sparse import block_diag, hstack, vstack
 
 from .MasterProblem import MasterProblem
 from .Result import Result
@@ -31,8 +31,7 @@ class DeterministicEquivalent:
         y = dec_vars[:num_arcs]
         z = dec_vars[num_arcs : num_arcs + num_scen]
 
-        for idx, sub in enumerate(subs):
-            self._add_subproblem(y, z[idx], sub)
+        self._add_subproblems(y, z)
 
     def solve(self, time_limit: float = np.inf) -> Optional[Result]:
         logger.info(f"Solving DEQ with {time_limit = :.2f} seconds.")
@@ -50,36 +49,57 @@ class DeterministicEquivalent:
 
         logger.info(f"Solving took {self.model.runTime:.2f}s.")
 
-        dec_vars = self.model.getVars()
-        x = dec_vars[: -len(self.subs)]
+        y = self.model.getVars()[: len(self.master.c)]
+        names = self.master.decision_names()
 
         return Result(
-            dict(zip(self.master.decision_names(), (var.x for var in x))),
-            dict(zip(self.master.decision_names(), self.master.c)),
+            dict(zip(names, self.model.getAttr("X", y))),
+            dict(zip(names, self.master.c)),
             [self.model.objBound],
             [self.model.objVal],
             [self.model.runTime],
             self.model.status == GRB.OPTIMAL,
         )
 
-    def _add_subproblem(self, y: MVar, z: Var, sub: SubProblem):
-        dec_vars = sub.model.getVars()[: sub.W.shape[1]]
-        x = self.model.addMVar(
-            (len(dec_vars),),
-            [var.lb for var in dec_vars],  # type: ignore
-            [var.ub for var in dec_vars],  # type: ignore
-            [var.obj for var in dec_vars],  # type: ignore
-            [var.vtype for var in dec_vars],  # type: ignore
-            name=f"x_{sub.scenario}",
-        )
+    def _add_subproblems(self, y: list[Var], z: list[Var]):
+        # The subproblems all share the same structure, so their variable
+        # attributes do not depend on the scenario. We read those only once.
+        first = self.subs[0]
+        dec_vars = first.model.getVars()[: first.W.shape[1]]
+        lb = first.model.getAttr("LB", dec_vars)
+        ub = first.model.getAttr("UB", dec_vars)
+        obj = first.model.getAttr("Obj", dec_vars)
+        vtype = first.model.getAttr("VType", dec_vars)
+
+        x: list[Var] = []
+        for sub in self.subs:
+            x_sub = self.model.addMVar(
+                (len(dec_vars),),
+                lb,  # type: ignore
+                ub,  # type: ignore
+                obj,  # type: ignore
+                vtype,  # type: ignore
+                name=f"x_{sub.scenario}",
+            )
+            x.extend(x_sub.tolist())
 
         # The right-hand side vector (h) consists of zeros and non-zero demand
         # terms. On the left hand side we add a column depending on h that
         # automatically makes the scenario feasible if z is one. To avoid
-        # numerical issues, we multiply h by 1.01.
+        # numerical issues, we multiply h by 1.01. All scenario blocks are
+        # stacked into a single constraint matrix, and added in one go.
+        mat = hstack(
+            [
+                vstack([sub.T for sub in self.subs]),
+                block_diag([sub.W for sub in self.subs]),
+                block_diag([1.01 * sub.h for sub in self.subs]),
+            ],
+            format="csr",
+        )
+
         self.model.addMConstr(
-            hstack([sub.T, sub.W, 1.01 * sub.h]),
-            y + x.tolist() + [z],
-            sense=sub.senses,
-            b=sub.h,
+            mat,
+            y + x + z,
+            sense=[sense for sub in self.subs for sense in sub.senses],
+            b=np.concatenate([sub.h[:, 0] for sub in self.subs]),
         )
@@ -16,5 +16,5 @@ class FlowMIS(SNC):
         col = col[..., np.newaxis]
 
         return self.model.addMConstr(
-            hstack([self.W, col]), None, self.senses, self.h
+            hstack([self.W, col], format="csr"), None, self.senses, self.h
         ).tolist()
@@ -3,6 +3,10 @@ from typing import Any, Dict
 
 import numpy as np
 
+# Module-level alias, to avoid looking up the asarray attribute on numpy in
+# every call to the object hook below.
+_asarray = np.asarray
+
 
 class JsonDecoder(json.JSONDecoder):
     def __init__(self, *args, **kwargs):
@@ -11,8 +15,17 @@ class JsonDecoder(json.JSONDecoder):
 
 
 def object_hook(obj: Dict[str, Any]) -> Dict[str, Any]:
-    for k, v in obj.items():
-        if isinstance(v, list):
-            obj[k] = np.array(v)
+    # The JSON parser only ever produces built-in lists, so an exact type
+    # check suffices here.
+    return {k: _to_array(v) if type(v) is list else v for k, v in obj.items()}
+
+
+def _to_array(values: list) -> np.ndarray:
+    # Lists starting with a float are converted directly to a float array,
+    # which skips numpy's dtype inference. That is safe even when ints follow.
+    # Other lists (ints, which may be followed by floats, or nested lists) are
+    # left to numpy to infer.
+    if values and type(values[0]) is float:
+        return _asarray(values, dtype=np.float64)
 
-    return obj
+    return _asarray(values)
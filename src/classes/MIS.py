@@ -25,5 +25,5 @@ class MIS(SNC):
         one[np.isclose(self.T.sum(axis=1), 0)] = 0
 
         return self.model.addMConstr(
-            hstack([self.W, one]), None, self.senses, self.h
+            hstack([self.W, one], format="csr"), None, self.senses, self.h
         ).tolist()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -65,15 +66,17 @@ class MasterProblem:
 
         self.model.update()
 
-    @property
+    @cached_property
     def c(self) -> np.array:
-        return np.array([y.obj for y in self._y])
+        # The objective coefficients do not change after construction, so we
+        # only need to read these from the model once.
+        return np.array(self.model.getAttr("Obj", self._y))
 
     def decisions(self) -> np.array:
-        return np.array([var.x for var in self._y])
+        return np.array(self.model.getAttr("X", self._y))
 
     def decision_names(self) -> list[str]:
-        return [var.varName for var in self._y]
+        return self.model.getAttr("VarName", self._y)
 
     def objective(self) -> float:
         assert self.model.status == GRB.OPTIMAL
@@ -146,8 +149,11 @@ class MasterProblem:
             y = np.array(model.cbGetSolution(self._y))
             z = np.array(model.cbGetSolution(self._z))
 
-            for z_i, sub in zip(z, subproblems):
-                if np.isclose(z_i, 1.0):  # allowed to be infeasible
+            may_violate = np.isclose(z, 1.0).tolist()
+            closed_arcs = np.isclose(y, 0)
+
+            for allowed, sub in zip(may_violate, subproblems):
+                if allowed:  # allowed to be infeasible
                     continue
 
                 sub.update_rhs(y)
@@ -166,7 +172,7 @@ class MasterProblem:
                     # infeasible. This works since the current arc capacity is
                     # infeasible for this scenario, and at least one additional
                     # arc needs to be opened.
-                    combinatorial_cut = Cut(np.isclose(y, 0), 1, sub.scenario)
+                    combinatorial_cut = Cut(closed_arcs, 1, sub.scenario)
                     self.add_cut(combinatorial_cut)
 
         self.model.optimize(callback)  # type: ignore
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
 
+import numpy as np
+
 
 @dataclass
 class Arc:
@@ -99,6 +101,58 @@ class ProblemData:
         destinations = {c.to_node for c in self.commodities}
         return sorted(destinations)
 
+    @cache
+    def arc_nodes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Start and end nodes of all arcs, as two arrays.
+        """
+        from_nodes = (arc.from_node for arc in self.arcs)
+        to_nodes = (arc.to_node for arc in self.arcs)
+
+        return (
+            np.fromiter(from_nodes, dtype=np.int32, count=self.num_arcs),
+            np.fromiter(to_nodes, dtype=np.int32, count=self.num_arcs),
+        )
+
+    @cache
+    def capacities(self) -> np.ndarray:
+        """
+        Arc capacities.
+        """
+        capacities = (arc.capacity for arc in self.arcs)
+        return np.fromiter(capacities, dtype=float, count=self.num_arcs)
+
+    @cache
+    def commodity_nodes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Origin and destination nodes of all commodities, as two arrays.
+        """
+        num_comm = self.num_commodities
+        from_nodes = (c.from_node for c in self.commodities)
+        to_nodes = (c.to_node for c in self.commodities)
+
+        return (
+            np.fromiter(from_nodes, dtype=np.int32, count=num_comm),
+            np.fromiter(to_nodes, dtype=np.int32, count=num_comm),
+        )
+
+    @cache
+    def fixed_costs(self) -> np.ndarray:
+        """
+        Fixed arc construction costs.
+        """
+        costs = (arc.fixed_cost for arc in self.arcs)
+        return np.fromiter(costs, dtype=float, count=self.num_arcs)
+
+    @cache
+    def demands(self) -> np.ndarray:
+        """
+        Demand matrix of shape (num_commodities, num_scenarios).
+        """
+        demands = [c.demands for c in self.commodities]
+        shape = (self.num_commodities, self.num_scenarios)
+        return np.array(demands, dtype=float).reshape(shape)
+
     @classmethod
     def from_file(cls, where: str | Path) -> "ProblemData":
         """
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from .JsonDecoder import JsonDecoder
 from .JsonEncoder import JsonEncoder
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+@cache
+def _instance(cls):
+    """
+    Returns a shared instance of the given encoder or decoder class. These are
+    stateless between calls, so there is no need to create a new one for each
+    file that is read or written.
+    """
+    return cls()
+
 
 @dataclass
 class Result:
@@ -56,8 +69,8 @@ class Result:
         Reads an object from the given location. Assumes the data at the given
         location are JSON-formatted.
         """
-        with open(loc, "r") as fh:
-            raw = json.load(fh, cls=decoder)
+        with open(loc) as fh:
+            raw = _instance(decoder).decode(fh.read())
 
         return cls(**raw)  # type: ignore
 
@@ -65,13 +78,21 @@ class Result:
         """
         Writes this object as JSON to the given location on the filesystem.
         """
-        with open(loc, "w") as fh:
-            json.dump(vars(self), fh, cls=encoder)
+        # Only the dataclass fields are persisted, since those are exactly the
+        # arguments from_file() passes back to the constructor.
+        data = {fld.name: getattr(self, fld.name) for fld in fields(self)}
+
+        # Unlike json.dump(), encode() uses the C-accelerated encoder, so we
+        # first encode to a string and write its bytes in one go.
+        with open(loc, "wb") as fh:
+            fh.write(_instance(encoder).encode(data).encode())
 
     def plot_convergence(self, ax: plt.Axes | None = None):
         """
         Plots the steps towards solution. Should hopefully show convergence.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots(figsize=(12, 8))
 
@@ -103,6 +124,8 @@ class Result:
         plt.draw_if_interactive()
 
     def plot_runtimes(self, ax: plt.Axes | None = None):
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots(figsize=(12, 4))
 
@@ -139,8 +162,11 @@ class Result:
             "(only non-zero decisions)\n",
         ]
 
-        for var, value in self.decisions.items():
-            if not np.isclose(value, 0.0):
+        values = np.array(list(self.decisions.values()))
+        nonzero = ~np.isclose(values, 0.0)
+
+        for var, value, keep in zip(self.decisions, values, nonzero):
+            if keep:
                 decisions.append(f"{var:>32}: {value:.2f}")
 
         return "\n".join(summary + decisions)
@@ -1,6 +1,5 @@
-import numpy as np
 from gurobipy import Constr, Var
-from scipy.sparse import hstack
+from scipy.sparse import csr_matrix, hstack
 
 from .SubProblem import SubProblem
 
@@ -27,9 +26,8 @@ class SNC(SubProblem):
 
     def _set_constrs(self) -> list[Constr]:
         sense2sign = {">": 1, "<": -1, "=": 0}
-        one = np.array([sense2sign[sense] for sense in self.senses])
-        one.shape = (len(one), 1)
+        one = csr_matrix([[sense2sign[sense]] for sense in self.senses])
 
         return self.model.addMConstr(
-            hstack([self.W, one]), None, self.senses, self.h
+            hstack([self.W, one], format="csr"), None, self.senses, self.h
         ).tolist()
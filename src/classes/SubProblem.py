@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING
 
 import igraph as ig
 import numpy as np
 from gurobipy import GRB, Constr, Model, Var
-from scipy.sparse import csr_matrix
 
 from src.config import DEFAULT_SUB_PARAMS
-from src.functions import create_sub_model
+from src.functions import create_sub_matrices
 
 from .Cut import Cut
 
@@ -20,6 +20,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _scenario_structure(data: ProblemData) -> tuple:
+    """
+    Creates the scenario-independent parts of the second-stage problem once:
+    the technology and recourse matrices T and W, constraint senses, variable
+    and constraint names, and a right-hand side template h. Also returns the
+    indices of the demand rows in h, in commodity order.
+    """
+    zeros = np.zeros(data.num_commodities)
+    T, W, senses, h, rows, vname, cname = create_sub_matrices(data, zeros)
+
+    return T, W, senses, vname, cname, h.reshape((len(h), 1)), rows
+
+
 class SubProblem(ABC):
     """
     Abstract base class for a subproblem formulation.
@@ -47,32 +61,38 @@ class SubProblem(ABC):
         self.scenario = scen
         self.without_metric_cuts = without_metric_cuts
 
-        demands = np.array([c.demands[scen] for c in data.commodities])
-        model = create_sub_model(data, demands)
+        # The constraint structure is the same for all scenarios, so we share
+        # it between subproblems. Only the demand rows of h need updating.
+        T, W, senses, vname, cname, h, rows = _scenario_structure(data)
+        self.T = T
+        self.W = W
+        self.senses = senses
+        self.vname = vname
+        self.cname = cname
 
-        mat = model.getA()
-        constrs = model.getConstrs()
-        dec_vars = model.getVars()
-
-        self.T = csr_matrix(mat[:, : data.num_arcs])
-        self.W = csr_matrix(mat[:, data.num_arcs :])
-        self.senses = [constr.sense for constr in constrs]
-        self.vname = [var.varName for var in dec_vars[data.num_arcs :]]
-        self.cname = [constr.constrName for constr in constrs]
-
-        h = [constr.rhs for constr in constrs]
-        self.h = np.array(h).reshape((len(h), 1))
+        demands = data.demands()[:, scen]
+        self.h = h.copy()
+        self.h[rows, 0] = demands
 
         self.model = Model(f"Sub #{self.scenario}")
 
         self.data = data
+        self._demands = demands
         self._y = np.zeros(data.num_arcs)
+        self._rhs = np.empty(len(self.h))  # buffer re-used by update_rhs()
         self.graph = ig.Graph(
             n=data.num_nodes + 1,
-            edges=[(a.from_node, a.to_node) for a in data.arcs],
+            edges=np.column_stack(data.arc_nodes()).tolist(),
             directed=True,
         )
 
+        # Positions of each commodity's origin and destination in the (sorted)
+        # lists of all origins and destinations. These index the distance
+        # matrix that is used to derive the metric cuts.
+        comm_from, comm_to = data.commodity_nodes()
+        self._orig_idcs = np.searchsorted(data.origins(), comm_from)
+        self._dest_idcs = np.searchsorted(data.destinations(), comm_to)
+
         for param, value in (DEFAULT_SUB_PARAMS | params).items():
             logger.debug(f"Setting {param} = {value}.")
             self.model.setParam(param, value)
@@ -80,11 +100,11 @@ class SubProblem(ABC):
         self._vars = self._set_vars()
         self._constrs = self._set_constrs()
 
-        for var, name in zip(self._vars, self.vname):
-            var.varName = name
-
-        for constr, name in zip(self._constrs, self.cname):
-            constr.constrName = name
+        # Set all names in one batched call per attribute, rather than writing
+        # each name individually.
+        named_vars = self._vars[: len(self.vname)]
+        self.model.setAttr("VarName", named_vars, self.vname)
+        self.model.setAttr("ConstrName", self._constrs, self.cname)
 
         self.model.update()
 
@@ -110,16 +130,17 @@ class SubProblem(ABC):
         pi = -duals[: self.data.num_arcs]
         pi[pi < 0] = 0  # is only ever negative due to rounding errors
 
-        gamma = 0
-        for commodity in self.data.commodities:
-            edge_idcs = self.graph.get_shortest_path(
-                commodity.from_node,
-                commodity.to_node,
-                weights=pi,
-                output="epath",
-            )
+        dists = self.graph.distances(
+            self.data.origins(),
+            self.data.destinations(),
+            weights=pi,
+        )
 
-            gamma += commodity.demands[self.scenario] * pi[edge_idcs].sum()
+        # Unreachable O-D pairs have infinite distance. These previously had an
+        # empty shortest path, which contributed nothing; we keep that here.
+        path_costs = np.array(dists)[self._orig_idcs, self._dest_idcs]
+        path_costs[~np.isfinite(path_costs)] = 0
+        gamma = float(self._demands @ path_costs)
 
         return Cut(beta, gamma, self.scenario)
 
@@ -136,7 +157,7 @@ class SubProblem(ABC):
     def update_rhs(self, y: np.ndarray):
         self._y = y
 
-        rhs = self.h - self.T @ y[..., np.newaxis]
-        rhs[rhs < 0] = 0  # is only ever negative due to rounding errors
+        np.subtract(self.h[:, 0], self.T @ y, out=self._rhs)
+        np.maximum(self._rhs, 0, out=self._rhs)  # < 0 only due to rounding
 
-        self.model.setAttr("RHS", self._constrs, rhs)  # type: ignore
+        self.model.setAttr("RHS", self._constrs, self._rhs)  # type: ignore
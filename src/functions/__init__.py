@@ -1,2 +1,3 @@
 from .create_master_model import create_master_model as create_master_model
+from .create_sub_matrices import create_sub_matrices as create_sub_matrices
 from .create_sub_model import create_sub_model as create_sub_model
@@ -20,7 +20,7 @@ def create_master_model(
     # by the problem instance.
     y = m.addMVar(
         (data.num_arcs,),
-        obj=[arc.fixed_cost for arc in data.arcs],  # type: ignore
+        obj=data.fixed_costs(),  # type: ignore
         vtype="B",  # type: ignore
         name=[str(arc) for arc in data.arcs],
     )
@@ -37,13 +37,15 @@ def create_master_model(
         # equivalent of the expected value scenario, and it is valid by a
         # suitable adaptation of Lemma 1 of Crainic et al. (2021)'s partial
         # Benders decomposition paper.
-        scen_demands = []
-        for c in data.commodities:
-            quantile = np.quantile(c.demands, 1 - alpha, method="higher")
-            sum_below = np.sum(c.demands, where=c.demands <= quantile)
-            scen_demands.append(sum_below / data.num_scenarios)
-
-        create_sub_model(data, scen_demands, m, y)  # create into given model
+        demands = data.demands()
+        quantiles = np.quantile(demands, 1 - alpha, axis=1, method="higher")
+        below = demands <= quantiles[:, np.newaxis]
+        sum_below = np.sum(demands, axis=1, where=below)
+        scen_demands = sum_below / data.num_scenarios
+
+        # Create into the given model. The variable and constraint names are
+        # not used in the master problem, so we skip generating those.
+        create_sub_model(data, scen_demands, m, y, with_names=False)
 
     m.update()
     return m
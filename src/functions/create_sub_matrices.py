@@ -0,0 +1,121 @@
+import numpy as np
+from gurobipy import GRB
+from scipy.sparse import csr_matrix
+
+from src.classes.ProblemData import ProblemData
+
+
+def create_sub_matrices(
+    data: ProblemData,
+    demands: np.ndarray[int],
+    with_names: bool = True,
+) -> tuple[
+    csr_matrix,
+    csr_matrix,
+    list[str],
+    np.ndarray,
+    np.ndarray,
+    list[str],
+    list[str],
+]:
+    """
+    Creates the second-stage constraints
+
+        Ty + Wx ~ h
+
+    directly as sparse matrices, without building a Gurobi model. Here, y are
+    the first-stage arc decisions and x the second-stage flow variables.
+    Returns the tuple (T, W, senses, h, demand_rows, vname, cname). Here,
+    demand_rows are the indices of the demand constraints in h, in commodity
+    order. Flow variables are named x[arc,commodity] after their arc and
+    commodity indices. Variable and constraint names are only generated when
+    ``with_names`` is set; otherwise, vname and cname are empty.
+    """
+    num_arcs = data.num_arcs
+    num_comm = data.num_commodities
+
+    arc_from, arc_to = data.arc_nodes()
+    comm_from, comm_to = data.commodity_nodes()
+
+    # Flows out of the destination, or into the origin, must be zero. We only
+    # create flow variables for the remaining (commodity, arc) pairs. Flow f
+    # is of commodity flow_comm[f], over arc flow_arcs[f].
+    valid = (arc_to[np.newaxis, :] != comm_from[:, np.newaxis]) & (
+        arc_from[np.newaxis, :] != comm_to[:, np.newaxis]
+    )
+
+    flow_comm, flow_arcs = np.nonzero(valid)
+    num_flows = len(flow_arcs)
+    flows = np.arange(num_flows)
+
+    # Capacity constraints: all flow through an arc must not exceed the arc's
+    # capacity. Each row has a one for every commodity's flow on the arc, and
+    # minus the arc's capacity for the arc's construction variable.
+    capacities = data.capacities()
+
+    # Balance constraints: one row for each commodity and node, except the
+    # commodity's origin. The rows are ordered by commodity, and then by node;
+    # row[k, n] is the row index of commodity k at node n, or -1 if there is
+    # no such row.
+    has_row = np.ones((num_comm, data.num_nodes + 1), dtype=bool)
+    has_row[:, 0] = False  # nodes are numbered from one
+    has_row[np.arange(num_comm), comm_from] = False
+
+    row_comm, row_node = np.nonzero(has_row)
+    num_bal = len(row_node)
+    row = np.full(has_row.shape, -1)
+    row[has_row] = np.arange(num_bal)
+
+    # Each flow enters the row of the arc's head node with coefficient +1,
+    # and the row of the arc's tail node with coefficient -1. The latter row
+    # does not exist when the tail is the commodity's origin. Flows out of
+    # the destination do not exist, so the destination row only has inflow.
+    in_rows = row[flow_comm, arc_to[flow_arcs]]
+    out_rows = row[flow_comm, arc_from[flow_arcs]]
+    has_out = out_rows >= 0
+
+    # The destination rows are demand constraints; all others are regular
+    # balance constraints for intermediate nodes.
+    is_dest = row_node == comm_to[row_comm]
+    senses = np.where(is_dest, GRB.GREATER_EQUAL, GRB.EQUAL).tolist()
+    demands = np.asarray(demands, dtype=float)
+    b = np.where(is_dest, demands[row_comm], 0)
+
+    # Each commodity has exactly one destination row, and the balance rows are
+    # ordered by commodity, so these are in commodity order.
+    demand_rows = num_arcs + np.flatnonzero(is_dest)
+
+    vname = []
+    cname = []
+    if with_names:
+        for arc, commodity_idx in zip(flow_arcs.tolist(), flow_comm.tolist()):
+            vname.append(f"x[{arc},{commodity_idx}]")
+
+        cname = [f"capacity{arc}" for arc in data.arcs]
+        for node, commodity_idx, dest in zip(
+            row_node.tolist(), row_comm.tolist(), is_dest.tolist()
+        ):
+            kind = "demand" if dest else "balance"
+            cname.append(f"{kind}{node, commodity_idx}")
+
+    T = csr_matrix(
+        (-capacities, (np.arange(num_arcs), np.arange(num_arcs))),
+        shape=(num_arcs + num_bal, num_arcs),
+    )
+
+    # W is assembled from a single set of (value, (row, col)) triplets, with
+    # the balance rows placed after the capacity rows. This converts to CSR
+    # exactly once, rather than building two blocks and stacking them.
+    num_out = np.count_nonzero(has_out)
+    vals = np.concatenate(
+        [np.ones(num_flows), np.ones(num_flows), -np.ones(num_out)]
+    )
+    rows = np.concatenate(
+        [flow_arcs, num_arcs + in_rows, num_arcs + out_rows[has_out]]
+    )
+    cols = np.concatenate([flows, flows, flows[has_out]])
+    W = csr_matrix((vals, (rows, cols)), shape=(num_arcs + num_bal, num_flows))
+    h = np.concatenate([np.zeros(num_arcs), b])
+
+    senses = [GRB.LESS_EQUAL] * num_arcs + senses
+    return T, W, senses, h, demand_rows, vname, cname
@@ -4,47 +4,70 @@ Ugly, one-off script that generates the multi-commodity benchmark instances.
 import csv
 import glob
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import chain
+
+import numpy as np
 
 from src.classes import ProblemData
 
 
-def parse_scen(where: str):
-    with open(where) as fh:
-        lines = iter(fh.readlines())
+def parse_scen(where: str) -> tuple[np.ndarray, np.ndarray]:
+    # The first line is the number of scenarios, but we already get that from
+    # the data. Each other line has the scenario probability, followed by the
+    # demand of each commodity.
+    scens = np.loadtxt(where, skiprows=1, ndmin=2)
+    return scens[:, 0], scens[:, 1:]
 
-    next(lines)  # = num scenarios, but we already get that from the data
 
-    for line in lines:
-        prob, *demands = map(float, line.strip().split())
-        yield prob, demands
+def copy_data(data: ProblemData) -> ProblemData:
+    # Arcs are shared, since they are never changed. The commodity demands and
+    # scenario probabilities are extended by make_problem_data(), so those are
+    # copied.
+    commodities = [
+        replace(comm, demands=list(comm.demands)) for comm in data.commodities
+    ]
+    return replace(
+        data,
+        commodities=commodities,
+        probabilities=list(data.probabilities),
+    )
 
 
-def make_problem_data(data: ProblemData, scenarios):
-    for prob, demands in scenarios:
-        data.probabilities.append(prob)
-        for commodity, demand in zip(data.commodities, demands):
-            commodity.demands.append(demand)
+def make_problem_data(data: ProblemData, probs, demands):
+    # Demands is a (scenario, commodity) matrix. Each commodity gets its whole
+    # column at once, rather than one demand per scenario.
+    data.probabilities.extend(np.asarray(probs).tolist())
+    comm_demands = np.asarray(demands).T.tolist()
+    for commodity, demand in zip(data.commodities, comm_demands):
+        commodity.demands.extend(demand)
 
 
-def main():
+def process_one(loc: str) -> list[dict]:
     experiments = []
 
-    for ndp in glob.glob("instances/base/*.dow"):
-        ndp = pathlib.Path(ndp)
-        group, typ = ndp.stem.split(".")
+    ndp = pathlib.Path(loc)
+    group, typ = ndp.stem.split(".")
 
-        for scen in glob.glob(f"instances/scenarios/{group}-0-*"):
-            _, _, size = scen.split("-")
+    for scen in glob.glob(f"instances/scenarios/{group}-0-*"):
+        _, _, size = scen.split("-")
 
-            if size == "1000":
-                scens = [(prob, demands) for prob, demands in parse_scen(scen)]
+        if size == "1000":
+            _, demands = parse_scen(scen)
+            base = ProblemData.from_file(ndp)
 
-                data = ProblemData.from_file(ndp)
-                scens_128 = [(1 / 128, demands) for _, demands in scens[:128]]
-                make_problem_data(data, scens_128)
+            # The 1000 scenarios are split into disjoint instances with 128,
+            # 256, and 512 equally likely scenarios.
+            start = 0
+            for num_scen in (128, 256, 512):
+                data = copy_data(base)
+                probs = np.full(num_scen, 1 / num_scen)
+                sub_demands = demands[start : start + num_scen]
+                make_problem_data(data, probs, sub_demands)
                 experiments.append(
                     dict(
-                        name=f"{group}-{typ}-128",
+                        name=f"{group}-{typ}-{num_scen}",
                         group=group,
                         ratio=typ,
                         num_nodes=data.num_nodes,
@@ -53,64 +76,41 @@ def main():
                         num_scenarios=data.num_scenarios,
                     )
                 )
-                data.to_file(f"instances/{group}-{typ}-128.ndp")
-
-                data = ProblemData.from_file(ndp)
-                scens_256 = [
-                    (1 / 256, demands) for _, demands in scens[128:384]
-                ]
-                make_problem_data(data, scens_256)
-                experiments.append(
-                    dict(
-                        name=f"{group}-{typ}-256",
-                        group=group,
-                        ratio=typ,
-                        num_nodes=data.num_nodes,
-                        num_arcs=data.num_arcs,
-                        num_commodities=data.num_commodities,
-                        num_scenarios=data.num_scenarios,
-                    )
+                data.to_file(f"instances/{group}-{typ}-{num_scen}.ndp")
+                start += num_scen
+        else:
+            data = ProblemData.from_file(ndp)
+            make_problem_data(data, *parse_scen(scen))
+
+            experiments.append(
+                dict(
+                    name=f"{group}-{typ}-{size}",
+                    group=group,
+                    ratio=typ,
+                    num_nodes=data.num_nodes,
+                    num_arcs=data.num_arcs,
+                    num_commodities=data.num_commodities,
+                    num_scenarios=data.num_scenarios,
                 )
-                data.to_file(f"instances/{group}-{typ}-256.ndp")
+            )
+            data.to_file(f"instances/{group}-{typ}-{size}.ndp")
 
-                data = ProblemData.from_file(ndp)
-                scens_512 = [
-                    (1 / 512, demands) for _, demands in scens[384:896]
-                ]
-                make_problem_data(data, scens_512)
-                experiments.append(
-                    dict(
-                        name=f"{group}-{typ}-512",
-                        group=group,
-                        ratio=typ,
-                        num_nodes=data.num_nodes,
-                        num_arcs=data.num_arcs,
-                        num_commodities=data.num_commodities,
-                        num_scenarios=data.num_scenarios,
-                    )
-                )
-                data.to_file(f"instances/{group}-{typ}-512.ndp")
-            else:
-                data = ProblemData.from_file(ndp)
-                make_problem_data(data, parse_scen(scen))
+    return experiments
 
-                experiments.append(
-                    dict(
-                        name=f"{group}-{typ}-{size}",
-                        group=group,
-                        ratio=typ,
-                        num_nodes=data.num_nodes,
-                        num_arcs=data.num_arcs,
-                        num_commodities=data.num_commodities,
-                        num_scenarios=data.num_scenarios,
-                    )
-                )
-                data.to_file(f"instances/{group}-{typ}-{size}.ndp")
+
+def main():
+    # Each base instance is converted independently of the others, so we can
+    # parallelise over them. The rows are still returned in glob order.
+    with ProcessPoolExecutor() as executor:
+        instances = glob.glob("instances/base/*.dow")
+        rows = executor.map(process_one, instances)
+        experiments = list(chain.from_iterable(rows))
 
     with open("instances/instances.csv", "w", newline="") as fh:
-        writer = csv.DictWriter(fh, list(experiments[0].keys()))
-        writer.writeheader()
-        writer.writerows(experiments)
+        header = list(experiments[0].keys())
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(tuple(exp[k] for k in header) for exp in experiments)
 
 
 if __name__ == "__main__":
@@ -3,40 +3,46 @@ Ugly, one-off script that generates the single-commodity benchmark instances.
 """
 import csv
 import glob
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from src.classes.ProblemData import ProblemData
 
 
+def process_one(loc: str) -> dict:
+    data = ProblemData.from_file(loc)
+    data = ProblemData(
+        data.num_nodes,
+        data.arcs,
+        data.commodities[:1],
+        data.probabilities,
+    )
+
+    data.to_file(f"instances/single-commodity/{Path(loc).name}")
+
+    return dict(
+        name=f"{Path(loc).stem}",
+        num_nodes=data.num_nodes,
+        num_arcs=data.num_arcs,
+        num_commodities=data.num_commodities,
+        num_scenarios=data.num_scenarios,
+    )
+
+
 def main():
-    experiments = []
-
-    for loc in glob.glob("instances/*.ndp"):
-        data = ProblemData.from_file(loc)
-        data = ProblemData(
-            data.num_nodes,
-            data.arcs,
-            data.commodities[:1],
-            data.probabilities,
-        )
-
-        data.to_file(f"instances/single-commodity/{Path(loc).name}")
-        experiments.append(
-            dict(
-                name=f"{Path(loc).stem}",
-                num_nodes=data.num_nodes,
-                num_arcs=data.num_arcs,
-                num_commodities=data.num_commodities,
-                num_scenarios=data.num_scenarios,
-            )
-        )
+    # Each instance is converted independently of the others, so we can
+    # parallelise over them. The rows are still returned in glob order.
+    with ProcessPoolExecutor() as executor:
+        instances = glob.glob("instances/*.ndp")
+        experiments = list(executor.map(process_one, instances))
 
     with open(
         "instances/single-commodity/instances.csv", "w", newline=""
     ) as fh:
-        writer = csv.DictWriter(fh, list(experiments[0].keys()))
-        writer.writeheader()
-        writer.writerows(experiments)
+        header = list(experiments[0].keys())
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(tuple(exp[k] for k in header) for exp in experiments)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@ further information on the available options.
 """
 from __future__ import annotations
 
+import logging.config
 from argparse import ArgumentParser
 
+import tomli
+
 from src.classes import (
     FORMULATIONS,
     DeterministicEquivalent,
@@ -15,6 +18,12 @@ from src.classes import (
 )
 
 
+def configure_logging(where: str = "logging.toml"):
+    with open(where, "rb") as fh:
+        settings = tomli.load(fh)
+        logging.config.dictConfig(settings)
+
+
 def parse_args():
     parser = ArgumentParser(prog="solve")
 
@@ -85,6 +94,7 @@ def run_deq(data, master, args) -> Result | None:
 
 
 def main():
+    configure_logging()
     args = parse_args()
 
     data = ProblemData.from_file(args.data_loc)